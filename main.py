@@ -8,11 +8,22 @@ For translation CLI, use: python translate.py
 """
 
 import argparse
+import os
 import sys
 
 
+def _sniff_subcommand(argv):
+    """返回命令行中的子命令名称（第一个非选项参数），不存在时返回 None"""
+    for arg in argv:
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
 def main():
     """Main CLI entry point"""
+    command = _sniff_subcommand(sys.argv[1:])
+
     parser = argparse.ArgumentParser(
         description="GlossaryFlow - 智能术语表驱动的可控翻译流程",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -56,11 +67,14 @@ def main():
         help='翻译文档 (推荐使用 translate.py)'
     )
     translate_parser.description = "翻译 Markdown 文档"
-    translate_parser.add_argument('input_file', help='输入文件')
-    translate_parser.add_argument('output_file', help='输出文件')
-    translate_parser.add_argument('--provider', help='LLM provider')
-    translate_parser.add_argument('--model', help='模型名称')
-    translate_parser.add_argument('--glossary', help='术语表文件')
+
+    # 仅在实际调用 translate 时才构建其参数，--help / web 路径无需这部分开销
+    if command == 'translate':
+        translate_parser.add_argument('input_file', help='输入文件')
+        translate_parser.add_argument('output_file', help='输出文件')
+        translate_parser.add_argument('--provider', help='LLM provider')
+        translate_parser.add_argument('--model', help='模型名称')
+        translate_parser.add_argument('--glossary', help='术语表文件')
 
     # 解析参数
     args = parser.parse_args()
@@ -72,12 +86,14 @@ def main():
     if args.command == 'web':
         print("🌐 启动 Web 服务...")
         print("💡 建议: 使用 'python run_web.py' 直接启动")
+        reload = os.environ.get("GLOSSARYFLOW_RELOAD", "0") == "1"
+        print(f"🔄 自动重载: {'开启' if reload else '关闭'} (设置 GLOSSARYFLOW_RELOAD=1 开启)")
         import uvicorn
         uvicorn.run(
             "src.api.main:app",
             host="0.0.0.0",
             port=8000,
-            reload=True
+            reload=reload
         )
         return 0
 
@@ -4,9 +4,10 @@ GlossaryFlow Web Server Entry Point
 
 This is the recommended way to start the web service.
 Usage: python run_web.py
+Set GLOSSARYFLOW_RELOAD=1 to enable auto-reload during development.
 """
 
-import uvicorn
+import os
 
 
 def main():
@@ -17,13 +18,18 @@ def main():
     print("💚 Health Check: http://localhost:8000/api/v1/health")
     print("\n⚠️  Make sure frontend is running separately:")
     print("   cd frontend && npm run dev")
+
+    reload = os.environ.get("GLOSSARYFLOW_RELOAD", "0") == "1"
+    print(f"\n🔄 Auto-reload: {'on' if reload else 'off'} (set GLOSSARYFLOW_RELOAD=1 to enable)")
     print("\n" + "="*60 + "\n")
 
+    # 延迟导入：仅在真正启动服务时才加载 uvicorn 及其依赖
+    import uvicorn
     uvicorn.run(
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
         log_level="info"
     )
 
@@ -4,9 +4,17 @@ Agents Module
 This module provides AI rewrite functionality for document processing.
 """
 
-# Currently only the AI Rewrite Agent is actively used
-# from .ai_rewrite_agent import AIRewriteAgent
+# Currently only the AI Rewrite Agent is actively used.
+# It is resolved lazily (PEP 562) so that importing the package does not
+# pull in the agent's dependencies until the class is actually requested.
 
 __all__ = [
     "AIRewriteAgent"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name == "AIRewriteAgent":
+        from .ai_rewrite_agent import AIRewriteAgent
+        return AIRewriteAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,7 @@ The full rewrite agent implementation is experimental and not yet complete.
 """
 
 from typing import Dict, Any, Optional
-import os
+from pathlib import Path
 
 
 class AIRewriteAgent:
@@ -24,8 +24,8 @@ class AIRewriteAgent:
         Args:
             output_dir: Directory for output files
         """
-        self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def rewrite_and_save(
         self,
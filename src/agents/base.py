@@ -4,8 +4,9 @@ Base Agent Interface
 统一定义所有 Agent 的基础接口和契约。
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -13,6 +14,7 @@ from enum import Enum
 from core.types import AgentType, JobStatus, ProcessingResult
 from core.job import Job
 from core.metadata import Metadata
+from core.serialization import json_dumps
 
 
 class AgentCapability(Enum):
@@ -32,7 +34,7 @@ class AgentConfig:
     model_name: str
     strategy_name: Optional[str] = None
     strategy_config: Dict[str, Any] = field(default_factory=dict)
-    capabilities: List[AgentCapability] = field(default_factory=list)
+    capabilities: Sequence[AgentCapability] = ()
     timeout_seconds: int = 30
     max_retries: int = 3
     temperature: float = 0.3
@@ -57,10 +59,14 @@ class BaseAgent(ABC):
         self._provider = None
         self._strategy = None
         self._prompt_manager = None
+        self._strategy_factory = None
 
         # 初始化组件
         self._initialize_components()
 
+        # 缓存 Agent 信息（仅在配置变化时重建）
+        self._refresh_agent_info()
+
     @property
     def agent_id(self) -> str:
         """获取 Agent ID"""
@@ -72,7 +78,7 @@ class BaseAgent(ABC):
         return self.config.agent_type
 
     @property
-    def capabilities(self) -> List[AgentCapability]:
+    def capabilities(self) -> Sequence[AgentCapability]:
         """获取 Agent 能力列表"""
         return self.config.capabilities
 
@@ -114,6 +120,21 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def aprocess(self, job: Job) -> ProcessingResult:
+        """
+        异步处理单个作业
+
+        默认在线程池中运行同步的 process()，避免阻塞事件循环；
+        Provider 支持原生异步调用的子类可以重写此方法。
+
+        Args:
+            job: 要处理的作业
+
+        Returns:
+            ProcessingResult: 处理结果
+        """
+        return await asyncio.to_thread(self.process, job)
+
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         执行 Agent 的主要功能
@@ -149,35 +170,84 @@ class BaseAgent(ABC):
             result = self.process(job)
 
             # 返回结果
-            return {
-                "job_id": job.job_id,
-                "status": result.status.value,
-                "result": result.to_dict(),
-                "metadata": self.metadata.to_dict(),
-                "agent_info": {
-                    "agent_id": self.agent_id,
-                    "agent_type": self.agent_type.value,
-                    "provider": self.config.provider_name,
-                    "model": self.config.model_name,
-                    "strategy": self.config.strategy_name
-                }
-            }
+            return self._build_response(job, result)
 
         except Exception as e:
-            return {
-                "job_id": input_data.get("job_id", "unknown"),
-                "status": JobStatus.FAILED.value,
-                "result": None,
-                "metadata": self.metadata.to_dict(),
-                "error": str(e),
-                "agent_info": {
-                    "agent_id": self.agent_id,
-                    "agent_type": self.agent_type.value,
-                    "provider": self.config.provider_name,
-                    "model": self.config.model_name,
-                    "strategy": self.config.strategy_name
-                }
-            }
+            return self._build_error_response(input_data, e)
+
+    async def aexecute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        异步执行 Agent 的主要功能
+
+        与 execute() 的输入输出一致，处理阶段通过 aprocess() 完成，
+        使多个作业可以在同一事件循环中重叠等待 LLM 响应。
+
+        Args:
+            input_data: 输入数据，同 execute()
+
+        Returns:
+            Dict[str, Any]: 输出数据，同 execute()
+        """
+        try:
+            job = Job.from_dict(input_data)
+
+            if not self.validate_input(job):
+                raise ValueError(f"Invalid input for agent {self.agent_id}")
+
+            result = await self.aprocess(job)
+
+            return self._build_response(job, result)
+
+        except Exception as e:
+            return self._build_error_response(input_data, e)
+
+    async def aexecute_many(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        并发执行多个作业
+
+        Args:
+            inputs: 输入数据列表，每项同 execute()
+
+        Returns:
+            List[Dict[str, Any]]: 与输入顺序一致的输出列表
+        """
+        return list(await asyncio.gather(*(self.aexecute(data) for data in inputs)))
+
+    def execute_json(self, input_data: Dict[str, Any]) -> bytes:
+        """
+        执行 Agent 并直接返回 JSON 序列化结果
+
+        供需要 JSON 输出的调用方（批量作业、HTTP 响应）使用，
+        安装了 orjson 时使用 orjson 序列化，否则回退到标准库 json。
+
+        Args:
+            input_data: 输入数据，同 execute()
+
+        Returns:
+            bytes: UTF-8 编码的 JSON 数据
+        """
+        return json_dumps(self.execute(input_data))
+
+    def _build_response(self, job: Job, result: ProcessingResult) -> Dict[str, Any]:
+        """构建成功响应"""
+        return {
+            "job_id": job.job_id,
+            "status": result.status.value,
+            "result": result.to_dict(),
+            "metadata": self.metadata.to_dict(),
+            "agent_info": dict(self._agent_info)
+        }
+
+    def _build_error_response(self, input_data: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """构建失败响应"""
+        return {
+            "job_id": input_data.get("job_id", "unknown"),
+            "status": JobStatus.FAILED.value,
+            "result": None,
+            "metadata": self.metadata.to_dict(),
+            "error": str(error),
+            "agent_info": dict(self._agent_info)
+        }
 
     def get_available_strategies(self) -> List[Dict[str, Any]]:
         """
@@ -186,7 +256,7 @@ class BaseAgent(ABC):
         Returns:
             策略信息列表
         """
-        if not hasattr(self, '_strategy_factory'):
+        if self._strategy_factory is None:
             return []
 
         return self._strategy_factory.list_strategies()
@@ -196,12 +266,32 @@ class BaseAgent(ABC):
         获取 Agent 信息
 
         Returns:
-            Agent 信息字典
+            Agent 信息字典（缓存数据的副本，调用方可自由修改）
         """
-        return {
+        info = dict(self._agent_info_full)
+        info["capabilities"] = list(info["capabilities"])
+        info["config"] = dict(info["config"])
+        return info
+
+    def _refresh_agent_info(self) -> None:
+        """
+        重建缓存的 Agent 信息
+
+        Agent 信息只依赖配置，在 __init__ 中构建一次；
+        子类在运行时修改配置（例如切换策略）后需调用此方法。
+        """
+        self._agent_type_value = self.config.agent_type.value
+        self._agent_info = {
+            "agent_id": self.agent_id,
+            "agent_type": self._agent_type_value,
+            "provider": self.config.provider_name,
+            "model": self.config.model_name,
+            "strategy": self.config.strategy_name
+        }
+        self._agent_info_full = {
             "agent_id": self.agent_id,
-            "agent_type": self.agent_type.value,
-            "capabilities": [cap.value for cap in self.capabilities],
+            "agent_type": self._agent_type_value,
+            "capabilities": [cap.value for cap in self.config.capabilities],
             "provider": self.config.provider_name,
             "model": self.config.model_name,
             "strategy": self.config.strategy_name,
@@ -213,4 +303,4 @@ class BaseAgent(ABC):
         }
 
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}(id={self.agent_id}, type={self.agent_type.value})>"
\ No newline at end of file
+        return f"<{self.__class__.__name__}(id={self.agent_id}, type={self._agent_type_value})>"
\ No newline at end of file
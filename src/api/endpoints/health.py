@@ -5,8 +5,9 @@ Provides health status and system information.
 """
 
 from typing import Dict, List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from api.models.common import HealthResponse
+from api.etag import compute_etag, etag_matches, not_modified
 
 from providers.registry import provider_registry
 from core.config import config
@@ -15,7 +16,7 @@ router = APIRouter()
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(request: Request, response: Response):
     """
     Check API health and system information
 
@@ -24,21 +25,13 @@ async def health_check():
     try:
         all_providers = provider_registry.list_available_providers()
 
-        provider_status = {}
-        truly_available_providers = []
+        # ✅ 使用真实 health_check()（批量并发执行，带短 TTL 缓存）
+        provider_status = await provider_registry.check_health_many(all_providers)
 
-        for provider_name in all_providers:
-            provider = provider_registry.get_or_create(provider_name)
-            # ✅ 使用真实 health_check()
-            if provider:
-                is_healthy, _ = provider.health_check()
-                provider_status[provider_name] = is_healthy
-
-                # ⚠️ CRITICAL: 仅统计真正可用的 provider
-                if is_healthy:
-                    truly_available_providers.append(provider_name)
-            else:
-                provider_status[provider_name] = False
+        # ⚠️ CRITICAL: 仅统计真正可用的 provider
+        truly_available_providers = [
+            provider_name for provider_name, is_healthy in provider_status.items() if is_healthy
+        ]
 
         # Determine overall health status
         # ⚠️ CRITICAL: 至少有一个可用 provider 才算 healthy
@@ -49,6 +42,12 @@ async def health_check():
         else:
             status = "down"  # 没有 provider
 
+        # 状态未变化时返回 304，跳过响应序列化
+        etag = compute_etag(status, tuple(provider_status.items()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+
         return HealthResponse(
             status=status,
             available_providers=truly_available_providers,  # ✅ 仅返回可用的
@@ -4,29 +4,41 @@ Providers Endpoint
 Manages and provides information about available LLM providers.
 """
 
+import asyncio
 from typing import Dict, List
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, HTTPException, Path, Request, Response
 
 from providers.registry import provider_registry
 from api.models.common import ProvidersResponse, ProviderStatus
+from api.etag import compute_etag, etag_matches, not_modified
 
 router = APIRouter()
 
 
 @router.get("/", response_model=ProvidersResponse)
-async def list_providers():
+async def list_providers(request: Request, response: Response):
     """
     List all available LLM providers
     """
     try:
         providers = provider_registry.list_available_providers()
+
+        etag = compute_etag(tuple(providers))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+
         return ProvidersResponse(providers=providers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list providers: {str(e)}")
 
 
 @router.get("/{provider_name}/status", response_model=ProviderStatus)
-async def get_provider_status(provider_name: str = Path(..., description="Provider name (e.g., openai, ollama, mock)")):
+async def get_provider_status(
+    request: Request,
+    response: Response,
+    provider_name: str = Path(..., description="Provider name (e.g., openai, ollama, mock)")
+):
     """
     Get status and information for a specific provider
 
@@ -37,17 +49,26 @@ async def get_provider_status(provider_name: str = Path(..., description="Provid
         if not provider:
             raise HTTPException(status_code=404, detail=f"Provider '{provider_name}' not found")
 
-        # ✅ 使用真实 health_check()
-        is_healthy, error_msg = provider.health_check()
+        # ✅ 使用真实 health_check()（带短 TTL 缓存）
+        is_healthy, error_msg = await asyncio.to_thread(
+            provider_registry.cached_health_check, provider_name, provider
+        )
 
         models = provider.get_available_models()
+        configuration_status = "Healthy" if is_healthy else f"Unhealthy: {error_msg}"
+
+        # 状态未变化时返回 304，跳过响应序列化
+        etag = compute_etag(provider_name, is_healthy, tuple(models), configuration_status)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
 
         return ProviderStatus(
             success=True,
             available=is_healthy,
             provider=provider_name,
             models=models,
-            configuration_status="Healthy" if is_healthy else f"Unhealthy: {error_msg}"
+            configuration_status=configuration_status
         )
 
     except HTTPException:
@@ -12,12 +12,13 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from agents.ai_rewrite_agent import AIRewriteAgent
 from api.models.common import JobStartResponse
 from api.websocket.manager import manager
+from api.storage import JobStore
 
 router = APIRouter()
 
 
 # In-memory job storage (will be replaced with database)
-job_storage: Dict[str, Dict[str, Any]] = {}
+job_storage = JobStore()
 
 
 @router.post("/rewrite", response_model=JobStartResponse)
@@ -35,24 +36,23 @@ async def start_rewrite(
         # Generate unique job ID
         job_id = str(uuid.uuid4())
 
-        # Initialize job storage
-        job_storage[job_id] = {
+        # Validate inputs
+        if not source_markdown.strip():
+            raise HTTPException(status_code=400, detail="Source markdown cannot be empty")
+
+        # Initialize job storage only after validation passes, so rejected
+        # requests never leave a record the TTL sweeper cannot evict
+        job_storage.create(job_id, {
             "id": job_id,
             "status": "validating",
             "progress": 0.0,
-            "source_markdown": source_markdown,
             "strategy": strategy,
             "document_context": document_context or {},
-            "llm_config": llm_config or {},
             "start_time": None,
             "end_time": None,
             "result": None,
             "error": None
-        }
-
-        # Validate inputs
-        if not source_markdown.strip():
-            raise HTTPException(status_code=400, detail="Source markdown cannot be empty")
+        })
 
         # Create output directory
         output_dir = "rewritten_docs"
@@ -83,11 +83,10 @@ async def get_rewrite_status(job_id: str):
     """
     Get the status of a rewrite job
     """
-    if job_id not in job_storage:
+    job = job_storage.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = job_storage[job_id]
-
     return {
         "success": True,
         "status": job["status"],
@@ -104,11 +103,10 @@ async def get_rewrite_result(job_id: str):
     """
     Get the final rewrite result
     """
-    if job_id not in job_storage:
+    job = job_storage.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = job_storage[job_id]
-
     if job["status"] != "completed":
         raise HTTPException(status_code=400, detail="Job not completed")
 
@@ -157,10 +155,15 @@ async def perform_rewrite(
     """
     Perform rewrite in background
     """
+    loop = asyncio.get_running_loop()
+
     try:
         # Update job status
-        job_storage[job_id]["status"] = "processing"
-        job_storage[job_id]["start_time"] = asyncio.get_event_loop().time()
+        job_storage.update(
+            job_id,
+            status="processing",
+            start_time=loop.time()
+        )
 
         await manager.send_status_update(job_id, "processing", 0.0)
 
@@ -189,24 +192,26 @@ async def perform_rewrite(
         }
 
         # Update job storage
-        job_storage[job_id].update({
-            "status": "completed",
-            "progress": 100.0,
-            "end_time": asyncio.get_event_loop().time(),
-            "result": rewrite_result
-        })
+        job_storage.update(
+            job_id,
+            status="completed",
+            progress=100.0,
+            end_time=loop.time(),
+            result=rewrite_result
+        )
 
         # Send completion notification
         await manager.send_completed(job_id, rewrite_result)
 
     except Exception as e:
         # Update job with error
-        job_storage[job_id].update({
-            "status": "error",
-            "progress": 0.0,
-            "end_time": asyncio.get_event_loop().time(),
-            "error": str(e)
-        })
+        job_storage.update(
+            job_id,
+            status="error",
+            progress=0.0,
+            end_time=loop.time(),
+            error=str(e)
+        )
 
         # Send error notification
         await manager.send_error(job_id, "REWRITE_ERROR", str(e))
\ No newline at end of file
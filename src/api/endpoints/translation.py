@@ -6,8 +6,9 @@ Handles document translation requests with real-time progress updates.
 
 import uuid
 import asyncio
+import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
 
@@ -15,7 +16,9 @@ from translator.markdown_translator import MarkdownTranslator
 from translator.glossary import Glossary
 from api.models.common import JobStartResponse, TranslationRequest
 from api.websocket.manager import manager
+from api.storage import JobStore
 from providers.registry import provider_registry
+from core.text import CHINESE_CHAR_PATTERN
 from core.exceptions import (
     ErrorCode,
     ProviderException,
@@ -23,11 +26,18 @@ from core.exceptions import (
     TranslationValidationException
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
 # In-memory job storage (will be replaced with database)
-job_storage: Dict[str, Dict[str, Any]] = {}
+job_storage = JobStore()
+
+# Provider 预检查通过的结果缓存时间（秒），只缓存成功结果
+PROVIDER_VALIDATION_TTL_SECONDS = 60.0
+# (provider_name, model_name) -> 过期时间（time.monotonic()）
+_validation_cache: Dict[Tuple[str, str], float] = {}
 
 
 def create_error_response(exception: TranslationException) -> Dict[str, Any]:
@@ -61,6 +71,12 @@ def validate_provider_availability(provider_name: str, model_name: str) -> None:
     Raises:
         ProviderException: 如果 Provider 不可用
     """
+    # TTL 内已验证通过的组合直接放行，避免重复的配置检查和模型列表请求
+    cache_key = (provider_name, model_name)
+    expires_at = _validation_cache.get(cache_key)
+    if expires_at is not None and expires_at > time.monotonic():
+        return
+
     # 检查 Provider 是否存在
     provider = provider_registry.get_or_create(provider_name)
     if not provider:
@@ -102,6 +118,8 @@ def validate_provider_availability(provider_name: str, model_name: str) -> None:
             }
         )
 
+    _validation_cache[cache_key] = time.monotonic() + PROVIDER_VALIDATION_TTL_SECONDS
+
 
 @router.post("/translate", response_model=JobStartResponse)
 async def start_translation(
@@ -111,35 +129,18 @@ async def start_translation(
     """
     Start a document translation job
     """
-    start_time = time.time()
-    print(f"\n{'='*60}")
-    print(f"[{time.time() - start_time:.3f}s] ⏱️  POST /translate called")
+    start_time = time.perf_counter()
+    logger.debug("POST /translate called")
 
     try:
         # Generate unique job ID
         job_id = str(uuid.uuid4())
-        print(f"[{time.time() - start_time:.3f}s] 🆔 Job ID generated: {job_id}")
+        logger.debug("[%.3fs] Job ID generated: %s", time.perf_counter() - start_time, job_id)
 
         # Extract data from request
         source_markdown = request.source_markdown
         glossary = request.glossary
         llm_config = request.llm_config
-        print(f"[{time.time() - start_time:.3f}s] 📦 Request data extracted")
-
-        # Initialize job storage
-        job_storage[job_id] = {
-            "id": job_id,
-            "status": "validating",
-            "progress": 0.0,
-            "source_markdown": source_markdown,
-            "glossary": glossary,
-            "llm_config": llm_config.dict() if llm_config else {},
-            "start_time": None,
-            "end_time": None,
-            "result": None,
-            "error": None
-        }
-        print(f"[{time.time() - start_time:.3f}s] 💾 Job storage initialized")
 
         # Validate inputs
         if not source_markdown.strip():
@@ -158,14 +159,18 @@ async def start_translation(
         temperature = llm_config.temperature if llm_config else 0.3
 
         # Log translation request
-        print(f"[{time.time() - start_time:.3f}s] 📝 Translation config: provider={provider_name}, model={model_name}, content_length={len(source_markdown)}")
+        logger.debug(
+            "[%.3fs] Translation config: provider=%s, model=%s, content_length=%d",
+            time.perf_counter() - start_time, provider_name, model_name, len(source_markdown)
+        )
 
         # ⚠️ CRITICAL: Fail Fast - 验证 Provider 可用性（在创建任务前）
+        # 验证可能发起网络探测，在线程池中执行避免阻塞事件循环
         try:
-            validate_provider_availability(provider_name, model_name)
+            await asyncio.to_thread(validate_provider_availability, provider_name, model_name)
         except ProviderException as e:
             # Provider 验证失败，直接返回错误（不创建任务）
-            print(f"[{time.time() - start_time:.3f}s] ❌ Provider validation failed: {e.message}")
+            logger.warning("Provider validation failed for job %s: %s", job_id, e.message)
             return JSONResponse(
                 status_code=400,
                 content=create_error_response(e)
@@ -174,12 +179,23 @@ async def start_translation(
         # Create glossary if provided
         gloss = None
         if glossary:
-            print(f"[{time.time() - start_time:.3f}s] 📖 Creating glossary...")
-            gloss = Glossary(glossary)
-            print(f"[{time.time() - start_time:.3f}s] ✅ Glossary created")
+            gloss = await asyncio.to_thread(Glossary, glossary)
+            logger.debug("[%.3fs] Glossary created", time.perf_counter() - start_time)
+
+        # Initialize job storage only after validation passes, so rejected
+        # requests never leave a record the TTL sweeper cannot evict
+        job_storage.create(job_id, {
+            "id": job_id,
+            "status": "validating",
+            "progress": 0.0,
+            "start_time": None,
+            "end_time": None,
+            "result": None,
+            "error": None
+        })
+        logger.debug("[%.3fs] Job storage initialized", time.perf_counter() - start_time)
 
         # Start translation in background
-        print(f"[{time.time() - start_time:.3f}s] 🚀 Adding background task for job {job_id}")
         background_tasks.add_task(
             perform_translation,
             job_id,
@@ -189,25 +205,19 @@ async def start_translation(
             temperature,
             gloss
         )
-        print(f"[{time.time() - start_time:.3f}s] ✅ Background task added")
 
         response = JobStartResponse(
             job_id=job_id,
             estimated_duration_ms=len(source_markdown) * 50  # Rough estimate
         )
 
-        total_time = time.time() - start_time
-        print(f"[{total_time:.3f}s] ✅ Translation job started: {job_id}")
-        print(f"{'='*60}\n")
+        logger.info("Translation job started: %s (%.3fs)", job_id, time.perf_counter() - start_time)
         return response
 
     except HTTPException:
         raise
     except Exception as e:
-        total_time = time.time() - start_time
-        print(f"[{total_time:.3f}s] ❌ Failed to start translation: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to start translation: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to start translation: {str(e)}")
 
 
@@ -216,11 +226,10 @@ async def get_translation_status(job_id: str):
     """
     Get the status of a translation job
     """
-    if job_id not in job_storage:
+    job = job_storage.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = job_storage[job_id]
-
     return {
         "success": True,
         "status": job["status"],
@@ -238,11 +247,10 @@ async def get_translation_result(job_id: str):
     """
     Get the final translation result (returns only the translated markdown content)
     """
-    if job_id not in job_storage:
+    job = job_storage.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = job_storage[job_id]
-
     if job["status"] != "completed":
         raise HTTPException(status_code=400, detail="Job not completed")
 
@@ -266,10 +274,15 @@ async def perform_translation(
     """
     Perform translation in background (runs in thread pool to avoid blocking)
     """
+    loop = asyncio.get_running_loop()
+
     try:
         # Update job status
-        job_storage[job_id]["status"] = "translating"
-        job_storage[job_id]["start_time"] = asyncio.get_event_loop().time()
+        job_storage.update(
+            job_id,
+            status="translating",
+            start_time=loop.time()
+        )
 
         await manager.send_status_update(job_id, "translating", 0.0)
 
@@ -280,21 +293,30 @@ async def perform_translation(
             glossary=glossary
         )
 
-        # Perform translation in thread pool to avoid blocking event loop
+        # Perform translation in thread pool to avoid blocking event loop;
+        # progress is also recorded on the job so status polling sees it
+        job_storage.update(job_id, progress=10.0)
         await manager.send_status_update(job_id, "translating", 10.0)
 
         # Run the synchronous translate() method in a thread pool
-        loop = asyncio.get_event_loop()
         translated_content = await loop.run_in_executor(
             None,  # Use default thread pool executor
             translator.translate,
             source_markdown
         )
 
+        job_storage.update(job_id, progress=90.0)
         await manager.send_status_update(job_id, "translating", 90.0)
 
+        # 不含中文的文档无需翻译：MarkdownTranslator 不调用 Provider、原样返回，
+        # 作为正常完成的作业处理，并在结果中给出提示
+        source_has_chinese = CHINESE_CHAR_PATTERN.search(source_markdown) is not None
+        warnings = [] if source_has_chinese else [
+            "Source markdown contains no Chinese text; returned unchanged"
+        ]
+
         # ⚠️ CRITICAL: 验证翻译结果，禁止返回原文作为"翻译结果"
-        if not translated_content or translated_content == source_markdown:
+        if not translated_content or (source_has_chinese and translated_content == source_markdown):
             raise TranslationException(
                 "Translation failed: output is empty or identical to input",
                 ErrorCode.TRANSLATION_VALIDATION_FAILED,
@@ -306,7 +328,7 @@ async def perform_translation(
             )
 
         # 验证翻译质量（中文字符比例）
-        chinese_chars = sum(1 for c in translated_content if '\u4e00' <= c <= '\u9fff')
+        chinese_chars = len(CHINESE_CHAR_PATTERN.findall(translated_content))
         chinese_ratio = chinese_chars / len(translated_content) if translated_content else 0
         if chinese_ratio > 0.5:
             raise TranslationValidationException(
@@ -325,17 +347,18 @@ async def perform_translation(
                 "provider_used": provider_name,
                 "model_used": model_name,
                 "glossary_applied": glossary is not None,
-                "warnings": []
+                "warnings": warnings
             }
         }
 
         # Update job storage
-        job_storage[job_id].update({
-            "status": "completed",
-            "progress": 100.0,
-            "end_time": asyncio.get_event_loop().time(),
-            "result": result
-        })
+        job_storage.update(
+            job_id,
+            status="completed",
+            progress=100.0,
+            end_time=loop.time(),
+            result=result
+        )
 
         # Send completion notification
         await manager.send_completed(job_id, result)
@@ -343,16 +366,15 @@ async def perform_translation(
     except Exception as e:
         # Update job with error
         error_msg = str(e)
-        print(f"❌ Translation failed for job {job_id}: {error_msg}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Translation failed for job %s: %s", job_id, error_msg)
 
-        job_storage[job_id].update({
-            "status": "error",
-            "progress": 0.0,
-            "end_time": asyncio.get_event_loop().time(),
-            "error": error_msg
-        })
+        job_storage.update(
+            job_id,
+            status="error",
+            progress=0.0,
+            end_time=loop.time(),
+            error=error_msg
+        )
 
         # Send error notification
         await manager.send_error(job_id, "TRANSLATION_ERROR", error_msg)
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+ETag Helpers
+
+Conditional GET support for read-mostly endpoints (health, providers).
+Clients that send back a matching If-None-Match get a bodyless 304 instead
+of a freshly serialized response.
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def compute_etag(*parts: Any) -> str:
+    """Compute a strong ETag from the values that determine a response body"""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the given ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison and may list several tags
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 Not Modified response carrying the current ETag"""
+    return Response(status_code=304, headers={"ETag": etag})
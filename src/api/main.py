@@ -4,6 +4,8 @@ FastAPI Main Application
 Document Translation and Rewrite API Server
 """
 
+import asyncio
+import logging
 import os
 import sys
 from contextlib import asynccontextmanager
@@ -20,10 +22,31 @@ from api.endpoints import translation, rewrite, health, providers
 from api.websocket import manager
 from core.config import config
 
+logger = logging.getLogger(__name__)
+
 # Job storage (in-memory for now, will be replaced with database)
 job_storage: Dict[str, Dict[str, Any]] = {}
 
 
+async def sweep_finished_jobs():
+    """Periodically evict finished jobs older than config.job_ttl"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(config.job_sweep_interval)
+        cutoff = loop.time() - config.job_ttl
+        # One bad sweep must not stop eviction for the rest of the process
+        try:
+            evicted = (
+                translation.job_storage.evict_finished(cutoff)
+                + rewrite.job_storage.evict_finished(cutoff)
+            )
+        except Exception:
+            logger.exception("Finished-job sweep failed, retrying next interval")
+            continue
+        if evicted:
+            print(f"🧹 Evicted {evicted} finished jobs")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
@@ -31,11 +54,17 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting Document Translation API...")
     print(f"📊 Default Provider: {config.provider}")
     print(f"🔧 Available Models: {config.openai_models}")
+    sweeper = asyncio.create_task(sweep_finished_jobs())
 
     yield
 
     # Shutdown
     print("🛑 Shutting down Document Translation API...")
+    sweeper.cancel()
+    try:
+        await sweeper
+    except asyncio.CancelledError:
+        pass
 
 
 # Create FastAPI application
@@ -128,6 +157,6 @@ if __name__ == "__main__":
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=os.environ.get("GLOSSARYFLOW_RELOAD", "0") == "1",
         log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Job Storage
+
+In-memory job storage shared by the translation and rewrite endpoints.
+"""
+
+from typing import Dict, Any, Optional
+
+# Jobs in these states never change again and can be evicted
+TERMINAL_STATUSES = frozenset({"completed", "error"})
+
+
+class JobStore:
+    """
+    In-memory job store keyed by job_id
+
+    All access happens on the event loop, so no locking is needed.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+
+    def create(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Store a new job"""
+        self._jobs[job_id] = job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID, or None if it does not exist"""
+        return self._jobs.get(job_id)
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Update fields of an existing job (no-op if the job does not exist)"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+
+    def evict_finished(self, ended_before: float) -> int:
+        """
+        Remove terminal jobs whose end_time is earlier than ended_before
+
+        Args:
+            ended_before: Cutoff on the event loop clock (loop.time())
+
+        Returns:
+            Number of jobs removed
+        """
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.get("status") in TERMINAL_STATUSES
+            and job.get("end_time") is not None
+            and job["end_time"] < ended_before
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        return len(expired)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
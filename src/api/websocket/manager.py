@@ -4,48 +4,66 @@ WebSocket Connection Manager
 Manages WebSocket connections for real-time progress updates.
 """
 
-import json
 import asyncio
-from typing import Dict, List, Any
+from typing import Dict, Set, Any
 from fastapi import WebSocket
 
+from core.serialization import json_dumps
+
+# Maximum number of sends awaited together before yielding to the event loop
+SEND_BATCH_SIZE = 50
+
 
 class ConnectionManager:
     """Manages WebSocket connections for job progress updates"""
 
     def __init__(self):
-        # Dictionary mapping job_id to list of WebSocket connections
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Dictionary mapping job_id to set of WebSocket connections
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
 
     async def connect(self, websocket: WebSocket, job_id: str):
         """Accept a WebSocket connection"""
         await websocket.accept()
-        if job_id not in self.active_connections:
-            self.active_connections[job_id] = []
-        self.active_connections[job_id].append(websocket)
+        self.active_connections.setdefault(job_id, set()).add(websocket)
         print(f"🔌 WebSocket connected for job {job_id}")
 
     def disconnect(self, websocket: WebSocket, job_id: str):
         """Remove a WebSocket connection"""
-        if job_id in self.active_connections:
-            self.active_connections[job_id].remove(websocket)
-            if not self.active_connections[job_id]:
+        connections = self.active_connections.get(job_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
                 del self.active_connections[job_id]
         print(f"🔌 WebSocket disconnected for job {job_id}")
 
     async def send_personal_message(self, message: Dict[str, Any], job_id: str):
         """Send a message to all connections for a specific job"""
-        if job_id in self.active_connections:
-            disconnected_connections = []
-            for connection in self.active_connections[job_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except:
-                    disconnected_connections.append(connection)
-
-            # Remove disconnected connections
-            for connection in disconnected_connections:
-                self.disconnect(connection, job_id)
+        connections = self.active_connections.get(job_id)
+        if not connections:
+            return
+
+        # Serialize once and send to all connections concurrently;
+        # snapshot the set since connections may change while awaiting
+        text = json_dumps(message).decode("utf-8")
+        connections = list(connections)
+        disconnected_connections = []
+        for start in range(0, len(connections), SEND_BATCH_SIZE):
+            if start:
+                # Yield to the event loop between large batches
+                await asyncio.sleep(0)
+            batch = connections[start:start + SEND_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(text) for connection in batch),
+                return_exceptions=True
+            )
+            disconnected_connections.extend(
+                connection for connection, result in zip(batch, results)
+                if isinstance(result, BaseException)
+            )
+
+        # Remove disconnected connections
+        for connection in disconnected_connections:
+            self.disconnect(connection, job_id)
 
     async def broadcast_progress(self, job_id: str, progress: float, phase: str, message: str = None):
         """Send progress update to all connections for a job"""
@@ -56,7 +74,7 @@ class ConnectionManager:
             "phase": phase,
             "phase_progress": progress,
             "message": message,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": asyncio.get_running_loop().time()
         }, job_id)
 
     async def send_status_update(self, job_id: str, status: str, progress: float = None):
@@ -65,7 +83,7 @@ class ConnectionManager:
             "type": "status_update",
             "job_id": job_id,
             "status": status,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": asyncio.get_running_loop().time()
         }
         if progress is not None:
             message["progress"] = progress
@@ -78,7 +96,7 @@ class ConnectionManager:
             "type": "warning",
             "job_id": job_id,
             "message": warning_message,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": asyncio.get_running_loop().time()
         }, job_id)
 
     async def send_completed(self, job_id: str, result: Dict[str, Any]):
@@ -87,7 +105,7 @@ class ConnectionManager:
             "type": "completed",
             "job_id": job_id,
             "result": result,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": asyncio.get_running_loop().time()
         }, job_id)
 
     async def send_error(self, job_id: str, error_code: str, error_message: str, details: Any = None):
@@ -100,12 +118,12 @@ class ConnectionManager:
                 "message": error_message,
                 "details": details
             },
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": asyncio.get_running_loop().time()
         }, job_id)
 
     def get_connection_count(self, job_id: str) -> int:
         """Get number of active connections for a job"""
-        return len(self.active_connections.get(job_id, []))
+        return len(self.active_connections.get(job_id, ()))
 
 
 # Global connection manager instance
@@ -123,8 +123,7 @@ class CLICommand(ABC):
         else:
             content = result.get('content', '')
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        output_file.write_text(content, encoding='utf-8')
 
     def format_output(self, result: Dict[str, Any], verbose: bool = False) -> None:
         """
@@ -83,6 +83,10 @@ class Config:
         self.enable_cache = os.getenv("ENABLE_CACHE", "false").lower() == "true"
         self.cache_ttl = int(os.getenv("CACHE_TTL", "3600"))  # 秒
 
+        # 作业存储配置：已结束的作业保留时间及清理间隔（秒）
+        self.job_ttl = self._parse_positive_int("JOB_TTL", "3600")
+        self.job_sweep_interval = self._parse_positive_int("JOB_SWEEP_INTERVAL", "600")
+
         # 术语表配置
         self.default_glossary_path = os.getenv("DEFAULT_GLOSSARY_PATH", "")
 
@@ -92,6 +96,22 @@ class Config:
         # 创建必要的目录
         self._ensure_directories()
 
+    def _parse_positive_int(self, env_name: str, default: str) -> int:
+        """
+        读取必须为正整数的环境变量
+
+        Raises:
+            ValueError: 值不是整数或不大于 0
+        """
+        raw_value = os.getenv(env_name, default)
+        try:
+            value = int(raw_value)
+        except ValueError:
+            raise ValueError(f"{env_name} must be a positive integer, got {raw_value!r}")
+        if value <= 0:
+            raise ValueError(f"{env_name} must be a positive integer, got {value}")
+        return value
+
     def _parse_models(self, models_str: str) -> list[str]:
         """
         解析模型字符串为列表
@@ -282,7 +302,9 @@ class Config:
             "preserve_metadata": self.preserve_metadata,
             "log_level": self.log_level,
             "enable_cache": self.enable_cache,
-            "cache_ttl": self.cache_ttl
+            "cache_ttl": self.cache_ttl,
+            "job_ttl": self.job_ttl,
+            "job_sweep_interval": self.job_sweep_interval
         }
 
 
@@ -152,12 +152,22 @@ class Metadata:
             return {}
 
         total_sessions = len(self.processing_history)
-        total_units = sum(m.units_processed for m in self.processing_history)
-        total_rewrites = sum(m.units_rewritten for m in self.processing_history)
-        total_time = sum(m.processing_time_ms for m in self.processing_history)
-
-        successful_sessions = len([m for m in self.processing_history if not m.errors])
-        avg_rewrite_rate = sum(m.rewrite_rate for m in self.processing_history) / total_sessions
+        total_units = 0
+        total_rewrites = 0
+        total_time = 0
+        total_rewrite_rate = 0.0
+        successful_sessions = 0
+
+        # 单次遍历累计所有指标
+        for m in self.processing_history:
+            total_units += m.units_processed
+            total_rewrites += m.units_rewritten
+            total_time += m.processing_time_ms
+            total_rewrite_rate += m.rewrite_rate
+            if not m.errors:
+                successful_sessions += 1
+
+        avg_rewrite_rate = total_rewrite_rate / total_sessions
 
         return {
             "total_sessions": total_sessions,
@@ -192,8 +202,10 @@ class Metadata:
             "statistics": self.get_statistics()
         }
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # 一次性序列化后整体写入，避免 json.dump 逐片段写文件
+        Path(file_path).write_bytes(
+            json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        )
 
     def load_from_file(self, file_path: str) -> None:
         """
@@ -16,6 +16,8 @@ import logging
 from typing import Tuple, Optional
 from typing import Dict, Any
 
+from core.text import CHINESE_CHAR_PATTERN
+
 logger = logging.getLogger(__name__)
 
 
@@ -132,6 +134,63 @@ class TranslationOutputContract:
         r'^以下是翻译后的?内容：\s*\n',
     ]
 
+    # Lines that start a whole section to remove (substring match, lowercase)
+    _SECTION_REMOVAL_MARKERS = (
+        'critical output requirements',
+        'important requirements',
+        'translation task start',
+        'translation task end',
+        'glossary:',
+        'terminology:',
+        '术语表',
+        'use these translations for specific terms',
+    )
+
+    # Single-line directives to remove (prefix match, lowercase)
+    _DIRECTIVE_STARTS = (
+        'you must',
+        'you must not',
+        'you should',
+        'do not',
+        'remember',
+        'note that',
+        'translate the following',
+        'you are a professional translator',
+    )
+
+    # Single-line prompt artifacts (substring match, lowercase)
+    _PROMPT_ARTIFACT_KEYWORDS = (
+        'variable names',
+        'brand names in english',
+        'preserve all',
+        'do not translate:',
+        'output only',
+        'terminology constraints:',
+        'you must use the following',
+        'when the chinese term appears',
+        'specified english translation',
+        'do not paraphrase',
+        'if a term in the glossary',
+    )
+
+    # Precompiled regexes (compiled once at class definition, not per call)
+    # Pattern lists are merged into one alternation each: alternatives are tried
+    # in list order, so "any match" and "first match wins" semantics are kept.
+    _SKIP_RE = re.compile('|'.join(f'(?:{p})' for p in SKIP_PATTERNS), re.IGNORECASE)
+    _VALID_CONTENT_START_RE = re.compile(
+        '|'.join(f'(?:{p})' for p in VALID_CONTENT_START_PATTERNS), re.IGNORECASE
+    )
+    _PREFIX_CLEANUP_RE = re.compile(
+        '|'.join(f'(?:{p})' for p in PREFIX_CLEANUP_PATTERNS), re.IGNORECASE | re.MULTILINE
+    )
+    _THINKING_TAG_RES = tuple(
+        re.compile(rf'<{tag}>.*?</{tag}>', re.DOTALL | re.IGNORECASE)
+        for tag in ('thinking', 'analysis', 'reasoning')
+    )
+    _ANSWER_OPEN_RE = re.compile(r'^\s*<answer>\s*\n*', re.MULTILINE)
+    _ANSWER_CLOSE_RE = re.compile(r'\s*</answer>\s*$', re.MULTILINE)
+    _ASSISTANT_PREFIX_RE = re.compile(r'^\s*assistant>\s*\n*', re.MULTILINE | re.IGNORECASE)
+
     @classmethod
     def parse_model_output(cls, raw_output: str, source_text: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
         """
@@ -205,9 +264,8 @@ class TranslationOutputContract:
         # Step 6: Final validation (non-destructive)
         metadata["cleaned_length"] = len(cleaned)
 
-        # Check for Chinese characters
-        chinese_count = sum(1 for c in cleaned if '\u4e00' <= c <= '\u9fff')
-        metadata["has_chinese"] = chinese_count > 0
+        # Check for Chinese characters (stops at the first match)
+        metadata["has_chinese"] = CHINESE_CHAR_PATTERN.search(cleaned) is not None
 
         # Validate: if cleaning removed too much AND no forced removal was applied, use original
         # But if forced removal was applied, accept the cleaned result even if much was removed
@@ -250,31 +308,28 @@ class TranslationOutputContract:
         skip_until_next_header = False
         skip_count = 0
 
+        # Hoist per-line lookups out of the loop
+        keep = cleaned_lines.append
+        section_markers = cls._SECTION_REMOVAL_MARKERS
+        directive_starts = cls._DIRECTIVE_STARTS
+        log_info = logger.info
+
         for i, line in enumerate(lines):
             stripped = line.strip()
 
             if not stripped:
                 if not skip_until_next_header:
-                    cleaned_lines.append(line)
+                    keep(line)
                 continue
 
             # Check if this is a section we want to skip
             line_lower = stripped.lower()
 
             # Detect start of sections to remove (entire blocks)
-            if any(pattern in line_lower for pattern in [
-                'critical output requirements',
-                'important requirements',
-                'translation task start',
-                'translation task end',
-                'glossary:',
-                'terminology:',
-                '术语表',
-                'use these translations for specific terms',
-            ]):
+            if any(marker in line_lower for marker in section_markers):
                 skip_until_next_header = True
                 skip_count = 0
-                logger.info(f"Forced removal: Starting skip at line {i}: {stripped[:50]}")
+                log_info(f"Forced removal: Starting skip at line {i}: {stripped[:50]}")
                 continue
 
             # If we're in skip mode
@@ -285,34 +340,23 @@ class TranslationOutputContract:
                 if stripped.startswith('#'):
                     # Found next section - stop skipping
                     skip_until_next_header = False
-                    logger.info(f"Forced removal: Stopped skip at line {i} (skipped {skip_count} lines), found header: {stripped[:50]}")
-                    cleaned_lines.append(line)
+                    log_info(f"Forced removal: Stopped skip at line {i} (skipped {skip_count} lines), found header: {stripped[:50]}")
+                    keep(line)
 
                 # Check if we've skipped too many lines (> 20 lines without finding a header)
                 elif skip_count > 20:
                     # Something's wrong, stop skipping
                     skip_until_next_header = False
                     logger.warning(f"Forced removal: Skipped {skip_count} lines without finding header, stopping skip")
-                    cleaned_lines.append(line)
+                    keep(line)
 
                 # Otherwise, skip this line (it's part of the section to remove)
                 continue
 
             # Remove directive lines (single-line directives)
             # Check for directive patterns at the START of the line
-            directive_starts = [
-                'you must',
-                'you must not',
-                'you should',
-                'do not',
-                'remember',
-                'note that',
-                'translate the following',
-                'you are a professional translator',
-            ]
-
-            if any(line_lower.startswith(pattern) for pattern in directive_starts):
-                logger.info(f"Forced removal: Removing directive line {i}: {stripped[:50]}")
+            if line_lower.startswith(directive_starts):
+                log_info(f"Forced removal: Removing directive line {i}: {stripped[:50]}")
                 continue
 
             # Remove glossary entry lines (- key: value pattern)
@@ -321,11 +365,11 @@ class TranslationOutputContract:
                 # Pattern: "- 中文: English" or "- Term: Definition"
                 after_dash = stripped[2:].strip()
                 if len(after_dash) < 100:  # Glossary entries are usually short
-                    logger.info(f"Forced removal: Removing glossary-like line {i}: {stripped[:50]}")
+                    log_info(f"Forced removal: Removing glossary-like line {i}: {stripped[:50]}")
                     continue
 
             # Keep this line
-            cleaned_lines.append(line)
+            keep(line)
 
         result = '\n'.join(cleaned_lines)
 
@@ -361,19 +405,13 @@ class TranslationOutputContract:
                 continue
 
             # Check if this line matches a skip pattern
-            should_skip = any(
-                re.search(pattern, stripped, re.IGNORECASE)
-                for pattern in cls.SKIP_PATTERNS
-            )
+            should_skip = cls._SKIP_RE.search(stripped) is not None
 
             if should_skip:
                 continue
 
             # Check if this looks like valid content start
-            is_valid_start = any(
-                re.match(pattern, stripped, re.IGNORECASE)
-                for pattern in cls.VALID_CONTENT_START_PATTERNS
-            )
+            is_valid_start = cls._VALID_CONTENT_START_RE.match(stripped) is not None
 
             # Also accept any substantial text as content
             is_substantial = len(stripped) > 40
@@ -416,19 +454,17 @@ class TranslationOutputContract:
     @classmethod
     def _remove_prefix_patterns(cls, text: str) -> str:
         """Remove known prefix patterns from the start of text."""
-        for pattern in cls.PREFIX_CLEANUP_PATTERNS:
-            match = re.match(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if match:
-                return text[match.end():]
+        match = cls._PREFIX_CLEANUP_RE.match(text)
+        if match:
+            return text[match.end():]
         return text
 
     @classmethod
     def _remove_thinking_tags(cls, text: str) -> str:
         """Remove <thinking>, <analysis>, <reasoning> tags and content."""
         # Remove thinking/analysis/reasoning blocks (multiline)
-        for tag in ['thinking', 'analysis', 'reasoning']:
-            pattern = rf'<{tag}>.*?</{tag}>'
-            text = re.sub(pattern, '', text, flags=re.DOTALL | re.IGNORECASE)
+        for regex in cls._THINKING_TAG_RES:
+            text = regex.sub('', text)
 
         # Clean up extra whitespace
         lines = text.split('\n')
@@ -448,13 +484,13 @@ class TranslationOutputContract:
         This method removes these tags safely.
         """
         # Remove <answer> opening tag
-        text = re.sub(r'^\s*<answer>\s*\n*', '', text, flags=re.MULTILINE)
+        text = cls._ANSWER_OPEN_RE.sub('', text)
 
         # Remove </answer> closing tag
-        text = re.sub(r'\s*</answer>\s*$', '', text, flags=re.MULTILINE)
+        text = cls._ANSWER_CLOSE_RE.sub('', text)
 
         # Remove assistant> prefix (if present)
-        text = re.sub(r'^\s*assistant>\s*\n*', '', text, flags=re.MULTILINE | re.IGNORECASE)
+        text = cls._ASSISTANT_PREFIX_RE.sub('', text)
 
         # Clean up extra whitespace
         lines = text.split('\n')
@@ -614,21 +650,10 @@ class TranslationOutputContract:
                 continue
 
             # Skip lines that are clearly prompt artifacts
+            stripped_lower = stripped.lower()
             is_artifact = any(
-                keyword in stripped.lower()
-                for keyword in [
-                    'variable names',
-                    'brand names in english',
-                    'preserve all',
-                    'do not translate:',
-                    'output only',
-                    'terminology constraints:',
-                    'you must use the following',
-                    'when the chinese term appears',
-                    'specified english translation',
-                    'do not paraphrase',
-                    'if a term in the glossary',
-                ]
+                keyword in stripped_lower
+                for keyword in cls._PROMPT_ARTIFACT_KEYWORDS
             )
 
             # But keep lines that look like actual content
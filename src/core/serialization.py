@@ -0,0 +1,35 @@
+"""
+Serialization Helpers
+
+共享的 JSON 序列化工具，供 Agent 结果和 WebSocket 消息共同使用。
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+# orjson 为可选依赖，缺失时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    """处理 JSON 无法直接序列化的类型"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(data: Any) -> bytes:
+    """序列化为 UTF-8 JSON 字节串"""
+    if orjson is not None:
+        return orjson.dumps(data, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=json_default, ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,13 @@
+"""
+Text Helpers
+
+文本处理共享常量，供翻译短路判断、翻译结果校验和输出清理共同使用。
+"""
+
+import re
+
+# 汉字（CJK 统一表意文字基本区、扩展 A 区、兼容表意文字及扩展 B 区以后的补充平面），
+# 用于判断文本是否包含中文及统计中文字符比例
+CHINESE_CHAR_PATTERN = re.compile(
+    r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\U00020000-\U0003134f]'
+)
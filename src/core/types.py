@@ -55,6 +55,18 @@ class ProcessingStats:
     error_count: int = 0
     warning_count: int = 0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式"""
+        return {
+            "units_processed": self.units_processed,
+            "units_rewritten": self.units_rewritten,
+            "rewrite_rate": self.rewrite_rate,
+            "processing_time_ms": self.processing_time_ms,
+            "token_usage": self.token_usage,
+            "error_count": self.error_count,
+            "warning_count": self.warning_count
+        }
+
 
 @dataclass
 class ProcessingResult:
@@ -76,15 +88,7 @@ class ProcessingResult:
             "status": self.status.value,
             "content": self.content,
             "metadata": self.metadata,
-            "stats": {
-                "units_processed": self.stats.units_processed,
-                "units_rewritten": self.stats.units_rewritten,
-                "rewrite_rate": self.stats.rewrite_rate,
-                "processing_time_ms": self.stats.processing_time_ms,
-                "token_usage": self.stats.token_usage,
-                "error_count": self.stats.error_count,
-                "warning_count": self.stats.warning_count
-            },
+            "stats": self.stats.to_dict(),
             "warnings": self.warnings,
             "error": self.error
         }
@@ -9,6 +9,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from core.text import CHINESE_CHAR_PATTERN
+
 
 class SectionType(Enum):
     """章节类型枚举"""
@@ -54,6 +56,9 @@ class MarkdownSection:
 class MarkdownParser:
     """Markdown 解析器"""
 
+    # 结构性行可能的首字符（数字与空白另行判断），用于跳过普通段落行的正则匹配
+    _STRUCTURAL_FIRST_CHARS = frozenset('#`-*+>|')
+
     def __init__(self):
         self.patterns = {
             'code_block': re.compile(r'^```'),
@@ -66,6 +71,15 @@ class MarkdownParser:
             'link': re.compile(r'\[.*?\]\([^)]+\)'),
             'inline_code': re.compile(r'`[^`]+`')
         }
+        # 结构性行的匹配顺序固定，预先构建避免每次调用重建列表
+        self._structural_patterns = (
+            self.patterns['header'],
+            self.patterns['code_block'],
+            self.patterns['list_item'],
+            self.patterns['blockquote'],
+            self.patterns['table'],
+            self.patterns['empty']
+        )
 
     def parse(self, content: str) -> List[MarkdownSection]:
         """
@@ -84,50 +98,46 @@ class MarkdownParser:
         sections = []
         current_line = 0
         current_char = 0
+        line_count = len(lines)
+
+        code_block_pattern = self.patterns['code_block']
+        header_pattern = self.patterns['header']
+        list_item_pattern = self.patterns['list_item']
+
+        while current_line < line_count:
+            line_stripped = lines[current_line].strip()
 
-        while current_line < len(lines):
-            line = lines[current_line]
-            line_stripped = line.strip()
-
-            # 检测章节类型并处理
-            if self.patterns['code_block'].match(line_stripped):
-                section = self._parse_code_block(lines, current_line, current_char)
-                sections.append(section)
-                current_line = section.line_end + 1
-                current_char += len(section.content) + 1  # +1 for newline
-            elif self.patterns['header'].match(line_stripped):
-                section = self._parse_header(lines, current_line, current_char)
-                sections.append(section)
-                current_line = section.line_end + 1
-                current_char += len(section.content) + 1
-            elif self.patterns['list_item'].match(line_stripped) or \
+            # 单次分类后分派到对应的解析方法
+            if code_block_pattern.match(line_stripped):
+                parse_section = self._parse_code_block
+            elif header_pattern.match(line_stripped):
+                parse_section = self._parse_header
+            elif list_item_pattern.match(line_stripped) or \
                  (current_line > 0 and self._is_continuation_line(lines, current_line)):
-                section = self._parse_list_items(lines, current_line, current_char)
-                sections.append(section)
-                current_line = section.line_end + 1
-                current_char += len(section.content) + 1
+                parse_section = self._parse_list_items
             else:
-                section = self._parse_paragraph(lines, current_line, current_char)
-                sections.append(section)
-                current_line = section.line_end + 1
-                current_char += len(section.content) + 1
+                parse_section = self._parse_paragraph
+
+            section = parse_section(lines, current_line, current_char)
+            sections.append(section)
+            current_line = section.line_end + 1
+            current_char += len(section.content) + 1  # +1 for newline
 
         return sections
 
     def _parse_code_block(self, lines: List[str], start_line: int, start_char: int) -> MarkdownSection:
         """解析代码块"""
-        code_lines = [lines[start_line]]
         line_count = len(lines)
+        code_block_pattern = self.patterns['code_block']
 
         i = start_line + 1
         while i < line_count:
-            line = lines[i]
-            code_lines.append(line)
-            if self.patterns['code_block'].match(line.strip()):
+            if code_block_pattern.match(lines[i].strip()):
                 break
             i += 1
 
-        content = '\n'.join(code_lines)
+        # 未闭合的代码块延续到文档末尾
+        content = '\n'.join(lines[start_line:i + 1])
         end_char = start_char + len(content)
 
         return MarkdownSection(
@@ -137,7 +147,7 @@ class MarkdownParser:
             line_end=i,
             char_start=start_char,
             char_end=end_char,
-            metadata={'language': self._extract_language(code_lines[0])}
+            metadata={'language': self._extract_language(lines[start_line])}
         )
 
     def _parse_header(self, lines: List[str], start_line: int, start_char: int) -> MarkdownSection:
@@ -162,27 +172,23 @@ class MarkdownParser:
 
     def _parse_list_items(self, lines: List[str], start_line: int, start_char: int) -> MarkdownSection:
         """解析列表项"""
-        list_lines = [lines[start_line]]
         i = start_line + 1
         line_count = len(lines)
+        list_item_pattern = self.patterns['list_item']
 
         while i < line_count:
-            line = lines[i]
-            line_stripped = line.strip()
-
             # 检查是否是列表项或续行
-            if (self.patterns['list_item'].match(line_stripped) or
+            if (list_item_pattern.match(lines[i].strip()) or
                 self._is_continuation_line(lines, i)):
-                list_lines.append(line)
                 i += 1
             else:
                 break
 
-        content = '\n'.join(list_lines)
+        content = '\n'.join(lines[start_line:i])
         end_char = start_char + len(content)
 
         # 检测列表类型
-        list_type = self._detect_list_type(list_lines[0])
+        list_type = self._detect_list_type(lines[start_line])
 
         return MarkdownSection(
             content=content,
@@ -196,23 +202,20 @@ class MarkdownParser:
 
     def _parse_paragraph(self, lines: List[str], start_line: int, start_char: int) -> MarkdownSection:
         """解析段落"""
-        paragraph_lines = [lines[start_line]]
         i = start_line + 1
         line_count = len(lines)
 
         while i < line_count:
-            line = lines[i]
-            line_stripped = line.strip()
+            line_stripped = lines[i].strip()
 
             # 检查是否应该继续段落
             if (line_stripped and
                 not self._is_structural_line(line_stripped)):
-                paragraph_lines.append(line)
                 i += 1
             else:
                 break
 
-        content = '\n'.join(paragraph_lines)
+        content = '\n'.join(lines[start_line:i])
         end_char = start_char + len(content)
 
         # 检测段落类型（包含链接、图片等）
@@ -245,14 +248,15 @@ class MarkdownParser:
 
     def _is_structural_line(self, line: str) -> bool:
         """检查是否是结构性行"""
-        return any(pattern.match(line) for pattern in [
-            self.patterns['header'],
-            self.patterns['code_block'],
-            self.patterns['list_item'],
-            self.patterns['blockquote'],
-            self.patterns['table'],
-            self.patterns['empty']
-        ])
+        if not line:
+            return True
+
+        first = line[0]
+        if (first not in self._STRUCTURAL_FIRST_CHARS and
+                not first.isdecimal() and not first.isspace()):
+            return False
+
+        return any(pattern.match(line) for pattern in self._structural_patterns)
 
     def _detect_list_type(self, line: str) -> str:
         """检测列表类型"""
@@ -271,9 +275,12 @@ class MarkdownParser:
             return SectionType.LINK
         elif self.patterns['inline_code'].search(content):
             return SectionType.INLINE_CODE
-        elif self.patterns['blockquote'].match(content.split('\n')[0]):
+
+        # 只取首行，避免切分整段内容
+        first_line = content.partition('\n')[0]
+        if self.patterns['blockquote'].match(first_line):
             return SectionType.BLOCKQUOTE
-        elif self.patterns['table'].match(content.split('\n')[0]):
+        elif self.patterns['table'].match(first_line):
             return SectionType.TABLE
         elif content.strip() == "":
             return SectionType.EMPTY
@@ -354,7 +361,7 @@ class MarkdownUtils:
 
         # 统计中英文单词
         english_words = len(re.findall(r'\b[a-zA-Z]+\b', content))
-        chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', content))
+        chinese_chars = len(CHINESE_CHAR_PATTERN.findall(content))
 
         return english_words + chinese_chars
 
@@ -29,6 +29,11 @@ class DataValidator:
     EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
     URL_PATTERN = re.compile(r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:\w*))?)?$')
 
+    # 需要移除的控制字符（保留 \t \n \r），用于 str.translate 删除表
+    CONTROL_CHARS_TABLE = dict.fromkeys(
+        [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f]
+    )
+
     @staticmethod
     def validate_agent_type(agent_type: Any) -> AgentType:
         """
@@ -346,7 +351,7 @@ class DataValidator:
             input_string = str(input_string)
 
         # 移除控制字符
-        sanitized = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', input_string)
+        sanitized = input_string.translate(DataValidator.CONTROL_CHARS_TABLE)
 
         # 截断长度
         if max_length and len(sanitized) > max_length:
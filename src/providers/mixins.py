@@ -4,7 +4,15 @@ Provider Mixins
 提供可复用的 Provider 校验逻辑。
 """
 
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
+
+# 常见的 API Key 占位符片段（如 .env.example 中的示例值）
+API_KEY_PLACEHOLDER_PATTERNS = (
+    "your_", "your-api", "your_api",
+    "placeholder", "example", "test_key",
+    "sk-xxx", "sk-xxxx", "sk-test",
+    "sk-your", "your_key"
+)
 
 
 class CloudProviderValidationMixin:
@@ -30,14 +38,8 @@ class CloudProviderValidationMixin:
             return False, "API key is missing"
 
         # 检查 API Key 是否为占位符
-        placeholder_patterns = [
-            "your_", "your-api", "your_api",
-            "placeholder", "example", "test_key",
-            "sk-xxx", "sk-xxxx", "sk-test",
-            "sk-your", "your_key"
-        ]
         api_key_lower = api_key.lower()
-        if any(pattern in api_key_lower for pattern in placeholder_patterns):
+        if any(pattern in api_key_lower for pattern in API_KEY_PLACEHOLDER_PATTERNS):
             return False, "API key appears to be a placeholder"
 
         # 检查 API Key 格式（基本验证）
@@ -55,20 +57,26 @@ class LocalProviderHealthMixin:
     """
 
     @staticmethod
-    def check_service_availability(base_url: str, timeout: int = 5) -> Tuple[bool, Optional[str]]:
+    def check_service_availability(
+        base_url: str,
+        timeout: int = 5,
+        session: Optional[Any] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         检查本地服务是否可用
 
         Args:
             base_url: 服务基础 URL
             timeout: 超时时间（秒）
+            session: 可选的 requests.Session，传入时复用其连接池（keep-alive）
 
         Returns:
             (is_available, error_message): 是否可用及错误信息
         """
         try:
             import requests
-            response = requests.get(f"{base_url}/api/tags", timeout=timeout)
+            http = session if session is not None else requests
+            response = http.get(f"{base_url}/api/tags", timeout=timeout)
             if response.status_code == 200:
                 return True, None
             else:
@@ -6,6 +6,7 @@ Mock LLM Provider 实现用于测试和开发，不依赖外部 API。
 
 import asyncio
 import re
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
@@ -141,7 +142,6 @@ class MockProvider(BaseProvider):
         Returns:
             生成的文本
         """
-        import time
         time.sleep(0.1)  # 模拟处理时间
 
         if "gpt" in model.lower():
@@ -244,7 +244,7 @@ class MockProvider(BaseProvider):
                 found_original = False
                 for line in lines:
                     if "原文：" in line:
-                        original_content = line.split("原文：", 1)[-1].strip()
+                        original_content = line.partition("原文：")[2].strip()
                         found_original = True
                     elif found_original and line.strip() and not line.strip().startswith('改写后：'):
                         original_content += line.strip()
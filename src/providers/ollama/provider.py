@@ -16,6 +16,18 @@ from core.types import ProviderType
 
 logger = logging.getLogger(__name__)
 
+# Ollama 本地模型可能需要更长时间（特别是7B+模型），生成请求超时 10 分钟
+GENERATE_TIMEOUT = 600
+# 查询模型列表、模型信息等元数据请求的超时时间
+METADATA_TIMEOUT = 10
+# 出现这些关键词说明 text 已是完整的翻译 prompt，无需再包装
+FULL_PROMPT_KEYWORDS = (
+    'translate all chinese text',
+    'you are a professional translator',
+    'important requirements',
+    'preserve all markdown formatting'
+)
+
 
 class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
     """Ollama Provider 实现"""
@@ -29,10 +41,8 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
         """
         super().__init__(config)
         self.base_url = config.base_url or "http://localhost:11434"
+        # requests.Session 不支持会话级超时，每个请求单独传入 timeout
         self.session = requests.Session()
-        # Ollama 本地模型可能需要更长时间（特别是7B+模型）
-        # 使用更长的超时时间：10分钟
-        self.session.timeout = 600
 
     def is_configured(self) -> bool:
         """
@@ -57,7 +67,9 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
         """
         # Local Provider 不要求 API Key
         # 只检查服务是否可达
-        is_available, error_msg = self.check_service_availability(self.base_url, timeout=5)
+        is_available, error_msg = self.check_service_availability(
+            self.base_url, timeout=5, session=self.session
+        )
         if not is_available:
             return False, error_msg
 
@@ -73,7 +85,9 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
             (is_healthy, error_message): 是否健康及错误信息
         """
         # 检查服务是否可访问
-        is_available, error_msg = self.check_service_availability(self.base_url, timeout=5)
+        is_available, error_msg = self.check_service_availability(
+            self.base_url, timeout=5, session=self.session
+        )
         if not is_available:
             return False, error_msg
 
@@ -95,7 +109,7 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
             模型名称列表
         """
         try:
-            response = self.session.get(f"{self.base_url}/api/tags")
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=METADATA_TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 models = data.get("models", [])
@@ -176,7 +190,7 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
             生成的文本
         """
         # Ollama 的 generate API 本身是同步的，在线程池中运行
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.generate, prompt, model, temperature, max_tokens, **kwargs)
 
     def generate(
@@ -216,7 +230,7 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
             response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
-                timeout=600  # 10 minutes for local models
+                timeout=GENERATE_TIMEOUT
             )
 
             if response.status_code == 200:
@@ -268,12 +282,7 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
 
         # 检查是否已经包含完整的翻译指令（避免双重包装）
         text_lower = text.lower()
-        is_full_prompt = any(keyword in text_lower for keyword in [
-            'translate all chinese text',
-            'you are a professional translator',
-            'important requirements',
-            'preserve all markdown formatting'
-        ])
+        is_full_prompt = any(keyword in text_lower for keyword in FULL_PROMPT_KEYWORDS)
 
         if is_full_prompt:
             # text已经是完整的prompt，直接使用generate
@@ -322,7 +331,8 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
         try:
             response = self.session.post(
                 f"{self.base_url}/api/pull",
-                json={"name": model_name}
+                json={"name": model_name},
+                timeout=GENERATE_TIMEOUT
             )
 
             return response.status_code == 200
@@ -343,7 +353,8 @@ class OllamaProvider(BaseProvider, LocalProviderHealthMixin):
         try:
             response = self.session.post(
                 f"{self.base_url}/api/show",
-                json={"name": model_name}
+                json={"name": model_name},
+                timeout=METADATA_TIMEOUT
             )
 
             if response.status_code == 200:
@@ -12,9 +12,20 @@ import openai
 from providers.base import BaseProvider, ProviderConfig, ModelInfo, ModelCapability
 from providers.mixins import CloudProviderValidationMixin
 from core.types import ProviderType
+from core.text import CHINESE_CHAR_PATTERN
 
 logger = logging.getLogger(__name__)
 
+# 出现这些关键词说明 text 已是完整的翻译 prompt，无需再包装
+FULL_PROMPT_KEYWORDS = (
+    'translate all chinese text',
+    'you are a professional translator',
+    'important requirements',
+    'preserve all markdown formatting',
+    'translate the following markdown document',
+    'critical output requirements'
+)
+
 
 class OpenAIProvider(BaseProvider, CloudProviderValidationMixin):
     """OpenAI GPT Provider 实现"""
@@ -41,7 +52,11 @@ class OpenAIProvider(BaseProvider, CloudProviderValidationMixin):
             return
 
         try:
-            client_kwargs = {"api_key": self.api_key}
+            # 超时下沉到 HTTP 客户端：所有请求共用同一超时，无需调用方另行处理
+            client_kwargs = {
+                "api_key": self.api_key,
+                "timeout": self.config.timeout_seconds
+            }
             if self.base_url:
                 client_kwargs["base_url"] = self.base_url
 
@@ -313,7 +328,7 @@ class OpenAIProvider(BaseProvider, CloudProviderValidationMixin):
             if content:
                 logger.info(f"Content preview (first 200 chars): {content[:200]}")
                 # Check if content is mostly Chinese
-                chinese_chars = sum(1 for c in content if '\u4e00' <= c <= '\u9fff')
+                chinese_chars = len(CHINESE_CHAR_PATTERN.findall(content))
                 chinese_ratio = chinese_chars / len(content) if content else 0
                 logger.info(f"Content Chinese character ratio: {chinese_ratio:.2%}")
 
@@ -372,14 +387,7 @@ class OpenAIProvider(BaseProvider, CloudProviderValidationMixin):
 
         # 检查是否已经包含完整的翻译指令（避免双重包装）
         text_lower = text.lower()
-        is_full_prompt = any(keyword in text_lower for keyword in [
-            'translate all chinese text',
-            'you are a professional translator',
-            'important requirements',
-            'preserve all markdown formatting',
-            'translate the following markdown document',
-            'critical output requirements'
-        ])
+        is_full_prompt = any(keyword in text_lower for keyword in FULL_PROMPT_KEYWORDS)
 
         logger.info(f"OpenAIProvider.translate: is_full_prompt={is_full_prompt}, text_length={len(text)}, model={model}")
         logger.info(f"OpenAIProvider.translate: text_preview={text[:200]}")
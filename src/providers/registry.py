@@ -4,13 +4,33 @@ Provider Registry
 Provider 注册中心，管理所有 LLM Provider 的注册和创建。
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from core.types import ProviderType
 from providers.base import BaseProvider, ProviderConfig
 
 logger = logging.getLogger(__name__)
 
+# health_check 结果缓存时间（秒），探活请求突发时合并为一次真实检查
+HEALTH_CHECK_TTL_SECONDS = 5.0
+
+# Provider 名称 -> 类型映射（键为规范化后的名称），模块加载时构建一次
+_PROVIDER_TYPE_BY_NAME: Dict[str, ProviderType] = {
+    "openai": ProviderType.OPENAI,
+    "ollama": ProviderType.OLLAMA,
+    "mimo": ProviderType.MIMO,
+    "deepseek": ProviderType.DEEPSEEK,
+    "mock": ProviderType.MOCK,
+    "qwen": ProviderType.QWEN,
+}
+
+
+def _normalize_provider_name(provider_name: str) -> str:
+    """规范化 Provider 名称，所有按名称查找的缓存和映射共用同一规则"""
+    return provider_name.casefold()
+
 
 class ProviderRegistry:
     """Provider 注册中心"""
@@ -19,6 +39,8 @@ class ProviderRegistry:
         self._providers: Dict[str, type] = {}
         self._provider_classes: Dict[ProviderType, type] = {}
         self._instances: Dict[str, BaseProvider] = {}
+        # provider_name -> (过期时间, (is_healthy, error_message))
+        self._health_cache: Dict[str, Tuple[float, Tuple[bool, Optional[str]]]] = {}
 
         # 注册默认 Provider 类
         self._register_default_classes()
@@ -87,7 +109,7 @@ class ProviderRegistry:
         if not isinstance(provider, BaseProvider):
             raise ValueError(f"Provider must be an instance of BaseProvider: {type(provider)}")
 
-        self._providers[name.lower()] = provider
+        self._providers[_normalize_provider_name(name)] = provider
         logger.debug(f"Registered provider: {name}")
 
     def get_or_create(self, provider_name: str, model: Optional[str] = None, config: Optional[ProviderConfig] = None) -> Optional[BaseProvider]:
@@ -102,7 +124,7 @@ class ProviderRegistry:
         Returns:
             Provider 实例或 None
         """
-        provider_name = provider_name.lower()
+        provider_name = _normalize_provider_name(provider_name)
 
         # 尝试从现有实例获取
         cache_key = f"{provider_name}:{model or 'default'}"
@@ -211,6 +233,62 @@ class ProviderRegistry:
         provider = self.get_or_create(provider_name)
         return provider is not None and provider.is_configured()
 
+    def cached_health_check(
+        self,
+        provider_name: str,
+        provider: BaseProvider,
+        ttl: float = HEALTH_CHECK_TTL_SECONDS
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        带 TTL 缓存的 health_check
+
+        health_check() 通常会发起真实网络请求，TTL 内重复调用直接返回缓存结果。
+
+        Args:
+            provider_name: Provider 名称
+            provider: Provider 实例
+            ttl: 缓存时间（秒）
+
+        Returns:
+            (is_healthy, error_message): 是否健康及错误信息
+        """
+        key = _normalize_provider_name(provider_name)
+        now = time.monotonic()
+
+        cached = self._health_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        result = provider.health_check()
+        self._health_cache[key] = (time.monotonic() + ttl, result)
+        return result
+
+    async def check_health_many(self, provider_names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        批量检查多个 Provider 的健康状态
+
+        一次完成实例获取与健康检查：各 Provider 的 cached_health_check()
+        在线程池中并发执行，总耗时取决于最慢的一个。
+
+        Args:
+            provider_names: Provider 名称列表，默认为所有已注册的 Provider
+
+        Returns:
+            Provider 名称 -> 是否健康，顺序与输入一致
+        """
+        if provider_names is None:
+            provider_names = self.list_available_providers()
+
+        async def check(provider_name: str) -> bool:
+            provider = self.get_or_create(provider_name)
+            if not provider:
+                return False
+            is_healthy, _ = await asyncio.to_thread(self.cached_health_check, provider_name, provider)
+            return is_healthy
+
+        results = await asyncio.gather(*(check(name) for name in provider_names))
+        return dict(zip(provider_names, results))
+
     def get_provider_info(self, provider_name: str) -> Optional[Dict[str, Any]]:
         """
         获取 Provider 信息
@@ -236,20 +314,12 @@ class ProviderRegistry:
         Returns:
             Provider 类型或 None
         """
-        provider_mapping = {
-            "openai": ProviderType.OPENAI,
-            "ollama": ProviderType.OLLAMA,
-            "mimo": ProviderType.MIMO,
-            "deepseek": ProviderType.DEEPSEEK,
-            "mock": ProviderType.MOCK,
-            "qwen": ProviderType.QWEN,
-        }
-
-        return provider_mapping.get(provider_name.lower())
+        return _PROVIDER_TYPE_BY_NAME.get(_normalize_provider_name(provider_name))
 
     def clear_cache(self) -> None:
         """清除 Provider 实例缓存"""
         self._instances.clear()
+        self._health_cache.clear()
         logger.debug("Cleared provider cache")
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -7,10 +7,14 @@ from providers.registry import provider_registry
 from translator.glossary import Glossary
 from core.config import config
 from core.output_contract import TranslationOutputContract
+from core.text import CHINESE_CHAR_PATTERN
 from prompt import PromptManager
 
 logger = logging.getLogger(__name__)
 
+# Delimiter that opens the document region in delimiter-style prompts (base_ollama.md)
+DOCUMENT_START_MARKER = "===DOCUMENT START==="
+
 class MarkdownTranslator:
     """Markdown document translator with structure preservation and glossary support"""
 
@@ -56,6 +60,9 @@ class MarkdownTranslator:
         self.is_reasoning_model = self._detect_reasoning_model(model_name)
         self.model_type = self._detect_model_type(model_name, provider_name)  # 'reasoning', 'chat', or 'mt-like'
 
+        # Complete prompt depends only on model type and glossary, built on first use
+        self._complete_prompt: Optional[str] = None
+
     def translate(self, markdown_text: str) -> str:
         """
         Translate markdown document while preserving structure and applying glossary
@@ -66,6 +73,11 @@ class MarkdownTranslator:
         Returns:
             Translated markdown text
         """
+        # Nothing to translate from Chinese: skip the provider call entirely
+        if not CHINESE_CHAR_PATTERN.search(markdown_text):
+            logger.info("No Chinese characters in input, skipping translation")
+            return markdown_text
+
         # Try translation with retry for failed translations
         # Only retry DeepSeek chat models, NOT mt-like models
         if self.model_type == 'chat':
@@ -83,7 +95,7 @@ class MarkdownTranslator:
                 # MT-like models: validate but don't retry (post-processing handles cleanup)
                 # The bilingual cleanup is already done in _clean_model_output
                 # Just log the final stats
-                chinese_char_count = sum(1 for char in result if '\u4e00' <= char <= '\u9fff')
+                chinese_char_count = len(CHINESE_CHAR_PATTERN.findall(result))
                 chinese_ratio = chinese_char_count / len(result) if result else 0
                 logger.info(f"MT-like translation final stats: {chinese_char_count} Chinese chars, ratio={chinese_ratio:.2%}")
                 # Always return result (bilingual cleanup already applied)
@@ -112,8 +124,10 @@ class MarkdownTranslator:
         Returns:
             Translated and cleaned markdown text
         """
-        # Build the complete prompt with optional glossary
-        prompt = self._build_complete_prompt()
+        # Build the complete prompt with optional glossary (once per translator)
+        if self._complete_prompt is None:
+            self._complete_prompt = self._build_complete_prompt()
+        prompt = self._complete_prompt
 
         # For retry attempts, add stronger translation directive
         if attempt > 0:
@@ -166,6 +180,12 @@ class MarkdownTranslator:
         """
         Build a stronger prompt for retry attempts.
 
+        The retry directive is added after the original instructions so the
+        shared prompt prefix stays identical across attempts (provider-side
+        prompt caching matches on prefixes). Prompts that open the document
+        region with a delimiter (base_ollama.md) get the directive inserted
+        before that delimiter, so it is never read as document text.
+
         Args:
             original_prompt: Original prompt
 
@@ -178,7 +198,10 @@ class MarkdownTranslator:
 - Do NOT repeat or copy the original Chinese text
 - Every Chinese character must be translated
 """
-        return f"{retry_instruction}\n{original_prompt}"
+        head, marker, tail = original_prompt.rpartition(DOCUMENT_START_MARKER)
+        if marker:
+            return f"{head.rstrip()}\n{retry_instruction}\n{marker}{tail}"
+        return f"{original_prompt}\n{retry_instruction}"
 
     def _validate_translation(self, translated_text: str) -> bool:
         """
@@ -194,7 +217,7 @@ class MarkdownTranslator:
             return False
 
         # Count Chinese characters
-        chinese_char_count = sum(1 for char in translated_text if '\u4e00' <= char <= '\u9fff')
+        chinese_char_count = len(CHINESE_CHAR_PATTERN.findall(translated_text))
         chinese_ratio = chinese_char_count / len(translated_text) if translated_text else 0
 
         logger.info(f"Translation validation: {chinese_char_count} Chinese chars, ratio={chinese_ratio:.2%}")
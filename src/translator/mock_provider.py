@@ -28,7 +28,7 @@ class MockLLMProvider(LLMProvider):
                     found_original = False
                     for line in lines:
                         if "原文：" in line:
-                            original_content = line.split("原文：", 1)[-1].strip()
+                            original_content = line.partition("原文：")[2].strip()
                             found_original = True
                         elif found_original and line.strip() and not line.strip().startswith('改写后：'):
                             # Continue capturing content if it spans multiple lines
@@ -12,6 +12,8 @@ class OllamaProvider(LLMProvider):
     def __init__(self, base_url: Optional[str] = None, model: Optional[str] = None):
         self.base_url = base_url or config.ollama_base_url
         self.model = model or config.ollama_model
+        # Reuse one connection pool for the availability check and generate calls
+        self.session = requests.Session()
 
     def translate(self, text: str, source_lang: str = "zh", target_lang: str = "en") -> str:
         """Translate text using Ollama"""
@@ -22,7 +24,7 @@ class OllamaProvider(LLMProvider):
             # Use the proper translation prompt
             prompt = self._get_translation_prompt() + f"\n\n{text}"
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
@@ -50,7 +52,7 @@ class OllamaProvider(LLMProvider):
     def is_configured(self) -> bool:
         """Check if Ollama is accessible"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except:
             return False
@@ -0,0 +1,6 @@
+"""Pytest configuration: make the src/ packages importable as in the app."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
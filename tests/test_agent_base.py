@@ -0,0 +1,68 @@
+"""BaseAgent 响应构建测试"""
+
+from agents.base import BaseAgent, AgentConfig, AgentCapability
+from core.types import AgentType, JobStatus, ProcessingResult, ProcessingStats
+
+
+class EchoAgent(BaseAgent):
+    """原样返回内容的测试 Agent"""
+
+    def _initialize_components(self) -> None:
+        pass
+
+    def validate_input(self, job) -> bool:
+        return True
+
+    def process(self, job) -> ProcessingResult:
+        return ProcessingResult(JobStatus.COMPLETED, job.content, {}, ProcessingStats())
+
+
+def make_agent() -> EchoAgent:
+    return EchoAgent(AgentConfig(
+        agent_id="echo",
+        agent_type=AgentType.REWRITE,
+        provider_name="mock",
+        model_name="mock-model",
+        capabilities=[AgentCapability.REWRITE]
+    ))
+
+
+def test_mutating_response_agent_info_does_not_leak():
+    agent = make_agent()
+
+    first = agent.execute({"job_id": "1", "content": "你好"})
+    first["agent_info"].pop("strategy")
+    first["agent_info"]["extra"] = True
+
+    second = agent.execute({"job_id": "2", "content": "你好"})
+    assert second["agent_info"] == {
+        "agent_id": "echo",
+        "agent_type": "rewrite",
+        "provider": "mock",
+        "model": "mock-model",
+        "strategy": None
+    }
+
+
+def test_mutating_get_agent_info_does_not_leak():
+    agent = make_agent()
+
+    info = agent.get_agent_info()
+    info["config"]["temperature"] = 1.0
+    info["capabilities"].append("qa")
+
+    fresh = agent.get_agent_info()
+    assert fresh["config"]["temperature"] == 0.3
+    assert fresh["capabilities"] == ["rewrite"]
+
+
+def test_refresh_agent_info_picks_up_config_changes():
+    agent = make_agent()
+
+    agent.config.agent_type = AgentType.TRANSLATION
+    agent.config.capabilities = [AgentCapability.TRANSLATION, AgentCapability.QA]
+    agent._refresh_agent_info()
+
+    info = agent.get_agent_info()
+    assert info["agent_type"] == "translation"
+    assert info["capabilities"] == ["translation", "qa"]